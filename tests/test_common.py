@@ -1,8 +1,15 @@
 import asyncio
+from unittest.mock import Mock, call
 
 import pytest
 
-from universal_silabs_flasher.common import StateMachine, Version, put_first
+from universal_silabs_flasher.common import (
+    SerialProtocol,
+    StateMachine,
+    Version,
+    crc16_ccitt,
+    put_first,
+)
 
 
 async def test_state_machine_bad_initial_state():
@@ -29,6 +36,37 @@ async def test_state_machine():
     assert sm.state == "a"
 
 
+async def test_state_machine_repeated_transitions():
+    sm = StateMachine(states={"a", "b"}, initial="a")
+
+    waiter = asyncio.create_task(sm.wait_for_state("b"))
+    cancelled = asyncio.create_task(sm.wait_for_state("b"))
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+
+    # Entering the state again before the waiters run does not fail
+    sm.state = "b"
+    sm.state = "b"
+
+    await waiter
+
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+
+@pytest.mark.parametrize(
+    "data, crc",
+    [
+        (b"", 0x0000),
+        (b"123456789", 0x31C3),
+        (b"\x14\x01\x00\x05\x00\xc0", 0x84C8),
+    ],
+)
+def test_crc16_ccitt(data, crc):
+    assert crc16_ccitt(data) == crc
+
+
 def test_put_first():
     assert put_first([1, 2, 3], [2]) == [2, 1, 3]
     assert put_first([1, 2, 3], [4]) == [4, 1, 2, 3]
@@ -82,3 +120,40 @@ def test_version_comparison_ezsp():
     assert not Version("7.2.2.0 build 191").compatible_with(
         Version("7.2.2.0 build 190")
     )
+
+
+@pytest.mark.parametrize(
+    "transport, previous_mode, calls",
+    [
+        # Enabled by us, so it is disabled again on disconnect
+        (Mock(), False, [call(True), call(False)]),
+        # Already enabled by the system, so it is left alone
+        (Mock(), True, []),
+        (
+            Mock(**{"serial.set_low_latency_mode.side_effect": ValueError()}),
+            False,
+            [call(True)],
+        ),
+        # The flag cannot be read, on Windows or for non-tty ports
+        (Mock(), OSError(), []),
+        (Mock(), ImportError(), []),
+        (Mock(spec=["write", "close"]), False, None),
+    ],
+)
+async def test_serial_protocol_low_latency(transport, previous_mode, calls, mocker):
+    mocker.patch(
+        "universal_silabs_flasher.common.get_low_latency_mode",
+        side_effect=[previous_mode],
+    )
+
+    protocol = SerialProtocol()
+    protocol.connection_made(transport)
+
+    await protocol.wait_until_connected()
+    assert protocol._transport is transport
+
+    protocol.disconnect()
+    transport.close.assert_called_once_with()
+
+    if calls is not None:
+        assert transport.serial.set_low_latency_mode.mock_calls == calls
@@ -0,0 +1,89 @@
+import pytest
+import zigpy.types
+
+from universal_silabs_flasher import cpc, cpc_types
+
+FRAME1 = cpc.CPCTransportFrame(
+    endpoint=cpc_types.EndpointId.SYSTEM,
+    control=zigpy.types.uint8_t(
+        (cpc_types.FrameType.UNNUMBERED << 6)
+        | (cpc_types.UnnumberedFrameType.POLL_FINAL << 0)
+    ),
+    payload=cpc.UnnumberedFrame(
+        command_id=cpc_types.UnnumberedFrameCommandId.PROP_VALUE_IS,
+        command_seq=zigpy.types.uint8_t(1),
+        payload=cpc.PropertyCommand(
+            property_id=cpc_types.PropertyId.SECONDARY_CPC_VERSION,
+            value=bytes.fromhex("040000000300000001000000"),
+        ),
+    ),
+)
+
+FRAME2 = cpc.CPCTransportFrame(
+    endpoint=cpc_types.EndpointId.SYSTEM,
+    control=zigpy.types.uint8_t(
+        (cpc_types.FrameType.UNNUMBERED << 6)
+        | (cpc_types.UnnumberedFrameType.POLL_FINAL << 0)
+    ),
+    payload=cpc.UnnumberedFrame(
+        command_id=cpc_types.UnnumberedFrameCommandId.RESET,
+        command_seq=zigpy.types.uint8_t(2),
+        payload=cpc.ResetCommand(status=cpc_types.Status.OK),
+    ),
+)
+
+FRAME1_BYTES = FRAME1.serialize()
+FRAME2_BYTES = FRAME2.serialize()
+
+
+def test_cpc_serialization():
+    assert FRAME1.serialize() == bytes.fromhex(
+        "14001600c457e5060110000300000004000000030000000100000012ca"
+    )
+    assert FRAME2.serialize() == bytes.fromhex("14000a00c455d301020400000000009121")
+
+
+def test_cpc_deserialize_returns_rest():
+    assert cpc.CPCTransportFrame.deserialize(FRAME1_BYTES + FRAME2_BYTES) == (
+        FRAME1,
+        FRAME2_BYTES,
+    )
+
+
+@pytest.mark.parametrize(
+    "chunks, frames",
+    [
+        # All at once
+        ([FRAME1_BYTES + FRAME2_BYTES], [FRAME1, FRAME2]),
+        # One byte at a time
+        (
+            [bytes([b]) for b in FRAME1_BYTES + FRAME2_BYTES],
+            [FRAME1, FRAME2],
+        ),
+        # Noise before a frame
+        ([b"noise", FRAME1_BYTES], [FRAME1]),
+        # A corrupted frame followed by a valid one
+        ([FRAME1_BYTES[:-1] + b"\x00", FRAME2_BYTES], [FRAME2]),
+    ],
+)
+def test_cpc_deserialization(chunks, frames, mocker):
+    protocol = cpc.CPCProtocol()
+    mocker.patch.object(protocol, "frame_received")
+
+    for chunk in chunks:
+        protocol.data_received(chunk)
+
+    assert [c.args[0] for c in protocol.frame_received.mock_calls] == frames
+    assert protocol._buffer == b""
+
+
+def test_cpc_bad_buffer_deserialization(mocker):
+    protocol = cpc.CPCProtocol()
+    mocker.patch.object(protocol, "frame_received")
+
+    # Short chunks of noise are not held onto while waiting for a full header
+    for _ in range(10):
+        protocol.data_received(b"aaa")
+
+    assert protocol._buffer == b""
+    assert not protocol.frame_received.mock_calls
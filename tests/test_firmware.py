@@ -3,7 +3,7 @@ import pathlib
 import pytest
 
 from universal_silabs_flasher import firmware
-from universal_silabs_flasher.common import Version
+from universal_silabs_flasher.common import Version, pad_to_multiple
 
 FIRMWARES_DIR = pathlib.Path(__file__).parent / "firmwares"
 
@@ -54,3 +54,21 @@ def test_firmware_gbl_valid_no_metadata():
 
     with pytest.raises(KeyError):
         fw.get_nabucasa_metadata()
+
+
+@pytest.mark.parametrize(
+    "filename",
+    [
+        "ncp-uart-sw-6.4.1.ebl",
+        "NabuCasa_SkyConnect_RCP_v4.1.3_rcp-uart-hw-802154_115200.gbl",
+        "NabuCasa_EZSP_v6.10.3.0_PB32_ncp-uart-hw_115200.gbl",
+    ],
+)
+def test_firmware_serialize_padded(filename):
+    data = (FIRMWARES_DIR / filename).read_bytes()
+    fw = firmware.parse_firmware_image(data)
+
+    assert fw.serialize_padded(128) == pad_to_multiple(data, 128, b"\xFF")
+
+    with pytest.raises(ValueError):
+        fw.serialize_padded(fw.PADDING_MULTIPLE + 1)
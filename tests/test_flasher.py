@@ -0,0 +1,58 @@
+import contextlib
+from unittest.mock import AsyncMock, call
+
+import pytest
+
+from universal_silabs_flasher import flasher as flasher_module
+from universal_silabs_flasher.common import Version
+from universal_silabs_flasher.const import ApplicationType
+from universal_silabs_flasher.flasher import Flasher, ProbeResult
+
+
+@pytest.mark.parametrize("run_firmware", [True, False])
+async def test_probe_gecko_bootloader_launch_delay(run_firmware, mocker):
+    flasher = Flasher(device="/dev/null")
+
+    gecko = AsyncMock()
+    gecko.probe.return_value = Version("2.00.01")
+
+    @contextlib.asynccontextmanager
+    async def connect_gecko_bootloader(baudrate):
+        yield gecko
+
+    mocker.patch.object(flasher, "_connect_gecko_bootloader", connect_gecko_bootloader)
+    sleep = mocker.patch.object(flasher_module.asyncio, "sleep", AsyncMock())
+
+    result = await flasher.probe_gecko_bootloader(
+        baudrate=115200, run_firmware=run_firmware
+    )
+
+    assert result.version == Version("2.00.01")
+    assert result.continue_probing is run_firmware
+
+    # The application launch delay is only needed if the application was launched
+    if run_firmware:
+        gecko.run_firmware.assert_called_once_with()
+        assert sleep.mock_calls == [call(flasher_module.APPLICATION_LAUNCH_DELAY)]
+    else:
+        gecko.run_firmware.assert_not_called()
+        sleep.assert_not_called()
+
+
+async def test_probe_app_type_uses_instance_probe_methods(mocker):
+    flasher = Flasher(device="/dev/null", baudrates={ApplicationType.EZSP: [115200]})
+    probe_ezsp = mocker.patch.object(
+        flasher,
+        "probe_ezsp",
+        AsyncMock(
+            return_value=ProbeResult(
+                version=Version("7.1.3.0"), baudrate=115200, continue_probing=False
+            )
+        ),
+    )
+
+    await flasher.probe_app_type(types=[ApplicationType.EZSP])
+
+    probe_ezsp.assert_called_once_with(baudrate=115200)
+    assert flasher.app_type == ApplicationType.EZSP
+    assert flasher.app_version == Version("7.1.3.0")
@@ -0,0 +1,87 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from universal_silabs_flasher import gecko_bootloader
+from universal_silabs_flasher.common import Version
+
+MENU = (
+    b"\r\nGecko Bootloader v1.12.00\r\n"
+    b"1. upload gbl\r\n"
+    b"2. run\r\n"
+    b"3. ebl info\r\n"
+    b"BL > "
+)
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        # All at once
+        [MENU],
+        # One byte at a time
+        [bytes([b]) for b in MENU],
+        # Noise before the menu
+        [b"\x00noise\r\n> ", MENU[:10], MENU[10:]],
+    ],
+)
+async def test_gecko_bootloader_menu_parsing(chunks):
+    protocol = gecko_bootloader.GeckoBootloaderProtocol()
+
+    for chunk in chunks:
+        protocol.data_received(chunk)
+
+    assert protocol._state_machine.state == gecko_bootloader.State.IN_MENU
+    assert protocol._version == Version("1.12.00")
+    assert protocol._buffer == b""
+
+
+async def test_gecko_bootloader_buffer_is_bounded():
+    protocol = gecko_bootloader.GeckoBootloaderProtocol()
+
+    for _ in range(100):
+        protocol.data_received(b"\x00" * 1000)
+        assert len(protocol._buffer) <= gecko_bootloader.MAX_BUFFER_SIZE
+
+    protocol.data_received(MENU)
+
+    assert protocol._state_machine.state == gecko_bootloader.State.IN_MENU
+    assert protocol._version == Version("1.12.00")
+
+
+@pytest.mark.parametrize(
+    "data, status",
+    [
+        (b"\r\nSerial upload complete\r\n", "complete"),
+        (b"\r\nSerial upload aborted\r\n", ""),
+        (b"\r\nSerial upload aborted\r\n\x00", ""),
+        (b"\r\nSerial upload aborted\r\nFailed: bad image\x00", "Failed: bad image"),
+        # Without a NUL, the message ends at the next line or the menu
+        (b"\r\nSerial upload aborted\r\nFailed: bad image\r\n", "Failed: bad image"),
+        (b"\r\nSerial upload aborted\r\nFailed: bad image", "Failed: bad image"),
+        # Overly long messages are truncated
+        (b"\r\nSerial upload aborted\r\n" + b"x" * 200, "x" * 128),
+    ],
+)
+async def test_gecko_bootloader_upload_status_parsing(data, status):
+    protocol = gecko_bootloader.GeckoBootloaderProtocol()
+    protocol._state_machine.state = gecko_bootloader.State.WAITING_UPLOAD_DONE
+
+    for b in data + MENU:
+        protocol.data_received(bytes([b]))
+
+    assert protocol._state_machine.state == gecko_bootloader.State.UPLOAD_DONE
+    assert protocol._upload_status == status
+
+
+async def test_gecko_bootloader_ebl_info():
+    protocol = gecko_bootloader.GeckoBootloaderProtocol()
+    transport = Mock(spec=["write"])
+    protocol.connection_made(transport)
+
+    asyncio.get_running_loop().call_soon(protocol.data_received, MENU)
+    version = await protocol.ebl_info()
+
+    assert version == Version("1.12.00")
+    transport.write.assert_called_once_with(b"\n3")
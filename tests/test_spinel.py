@@ -63,3 +63,43 @@ def test_hdlc_lite_encoding_decoding(encoded, decoded):
 def test_spinel_parsing(encoded, decoded):
     assert spinel.SpinelFrame.from_bytes(encoded) == decoded
     assert decoded.serialize() == encoded
+
+
+@pytest.mark.parametrize(
+    "chunks",
+    [
+        # All at once
+        [bytes.fromhex("7e810243d3d37e7e810365010b287e")],
+        # One byte at a time
+        [bytes([b]) for b in bytes.fromhex("7e810243d3d37e7e810365010b287e")],
+        # The second frame is split after the first one ends
+        [bytes.fromhex("7e810243d3d37e7e8103"), bytes.fromhex("65010b287e")],
+    ],
+)
+def test_spinel_protocol_data_received(chunks, mocker):
+    protocol = spinel.SpinelProtocol()
+    mocker.patch.object(protocol, "frame_received")
+
+    for chunk in chunks:
+        protocol.data_received(chunk)
+
+    frames = [c.args[0] for c in protocol.frame_received.mock_calls]
+    assert [f.serialize() for f in frames] == [
+        bytes.fromhex("810243"),
+        bytes.fromhex("81036501"),
+    ]
+    assert protocol._buffer == b""
+
+
+def test_spinel_protocol_frame_received_can_resize_buffer(mocker):
+    protocol = spinel.SpinelProtocol()
+
+    # Handlers may write into the buffer, it must not be exported at this point
+    mocker.patch.object(
+        protocol, "frame_received", side_effect=lambda f: protocol._buffer.extend(b"!")
+    )
+
+    protocol.data_received(bytes.fromhex("7e810243d3d37e7e81"))
+
+    assert len(protocol.frame_received.mock_calls) == 1
+    assert protocol._buffer == b"\x81!"
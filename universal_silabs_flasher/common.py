@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import array
 import asyncio
+import binascii
 import collections
 import contextlib
 import dataclasses
@@ -23,17 +25,8 @@ _LOGGER = logging.getLogger(__name__)
 CONNECT_TIMEOUT = 1
 PROBE_TIMEOUT = 2
 
+ASYNC_LOW_LATENCY = 0x2000
 
-CRC_CCITT = crc.Calculator(
-    crc.Configuration(
-        width=16,
-        polynomial=0x1021,
-        init_value=0x0000,
-        final_xor_value=0x0000,
-        reverse_input=False,
-        reverse_output=False,
-    )
-)
 
 CRC_KERMIT = crc.Calculator(
     crc.Configuration(
@@ -43,13 +36,15 @@ CRC_KERMIT = crc.Calculator(
         final_xor_value=0xFFFF,
         reverse_input=True,
         reverse_output=True,
-    )
+    ),
+    optimized=True,
 )
 
 
 # Used by both CPC and XModem
 def crc16_ccitt(data: bytes) -> int:
-    return CRC_CCITT.checksum(data)
+    # `crc_hqx` is a table-driven CRC-16-CCITT (polynomial 0x1021) implemented in C
+    return binascii.crc_hqx(data, 0x0000)
 
 
 # Used by HDLC-Lite
@@ -98,8 +93,11 @@ class StateMachine:
 
         self._state = state
 
+        # Waiters are only woken once, even if the state is entered again before they
+        # have had a chance to run or they have been cancelled
         for future in self._futures_for_state[state]:
-            future.set_result(None)
+            if not future.done():
+                future.set_result(None)
 
     async def wait_for_state(self, state: str) -> None:
         """Waits for a state. Returns immediately if the state is active."""
@@ -118,6 +116,19 @@ class StateMachine:
             self._futures_for_state[state].remove(future)
 
 
+def get_low_latency_mode(serial: typing.Any) -> bool:
+    """Read the `ASYNC_LOW_LATENCY` flag of a Linux tty, pyserial can only set it."""
+    # Neither module exists on Windows
+    import fcntl
+    import termios
+
+    # `struct serial_struct`, as read by pyserial's `set_low_latency_mode`
+    buf = array.array("i", [0] * 32)
+    fcntl.ioctl(serial.fd, termios.TIOCGSERIAL, buf)
+
+    return bool(buf[4] & ASYNC_LOW_LATENCY)
+
+
 class SerialProtocol(asyncio.Protocol):
     """Base class for packet-parsing serial protocol implementations."""
 
@@ -126,6 +137,9 @@ class SerialProtocol(asyncio.Protocol):
         self._transport: serial_asyncio.SerialTransport | None = None
         self._connected_event = asyncio.Event()
 
+        # Only set if low latency mode was enabled by us, not by the system
+        self._low_latency_enabled: bool = False
+
     async def wait_until_connected(self) -> None:
         """Wait for the protocol's transport to be connected."""
         await self._connected_event.wait()
@@ -133,6 +147,14 @@ class SerialProtocol(asyncio.Protocol):
     def connection_made(self, transport: serial_asyncio.SerialTransport) -> None:
         _LOGGER.debug("Connection made: %s", transport)
 
+        # Reduce the receive latency of USB serial adapters, where the platform allows
+        try:
+            if not get_low_latency_mode(transport.serial):
+                transport.serial.set_low_latency_mode(True)
+                self._low_latency_enabled = True
+        except (ImportError, AttributeError, ValueError, OSError) as e:
+            _LOGGER.debug("Could not enable low latency mode: %r", e)
+
         self._transport = transport
         self._connected_event.set()
 
@@ -149,6 +171,16 @@ class SerialProtocol(asyncio.Protocol):
 
     def disconnect(self) -> None:
         if self._transport is not None:
+            # Low latency mode is a property of the tty and outlives our process, it
+            # is only disabled if it was not already enabled before we connected
+            if self._low_latency_enabled:
+                try:
+                    self._transport.serial.set_low_latency_mode(False)
+                except (AttributeError, ValueError, OSError) as e:
+                    _LOGGER.debug("Could not disable low latency mode: %r", e)
+
+                self._low_latency_enabled = False
+
             self._transport.close()
             self._buffer.clear()
             self._connected_event.clear()
@@ -224,7 +256,9 @@ class CommaSeparatedNumbers(click.ParamType):
 
 def put_first(lst: list[typing.Any], elements: list[typing.Any]) -> list[typing.Any]:
     """Orders a list so that the provided element is first."""
-    return elements + [e for e in lst if e not in elements]
+    first = set(elements)
+
+    return elements + [e for e in lst if e not in first]
 
 
 @dataclasses.dataclass(frozen=True, order=True)
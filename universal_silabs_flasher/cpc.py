@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import dataclasses
 import logging
-import typing
+import struct
 
 import async_timeout
 import zigpy.types
@@ -13,15 +13,29 @@ from .common import BufferTooShort, SerialProtocol, Version, crc16_ccitt
 
 _LOGGER = logging.getLogger(__name__)
 
+# Flag, endpoint, length, and control fields of the transport frame header
+HEADER = struct.Struct("<BBHB")
+CHECKSUM = struct.Struct("<H")
 
-def parse_subframe(cpc_frame: CPCTransportFrame) -> UnnumberedFrame:
+
+def parse_frame_type(control: int) -> cpc_types.FrameType:
+    """Parses the frame type from a CPC frame's control field."""
+    frame_type = (control & 0b11000000) >> 6
+
+    if frame_type == 0:
+        frame_type = 1
+
+    return cpc_types.FrameType(frame_type)
+
+
+def parse_subframe(control: int, payload: bytes) -> UnnumberedFrame:
     """Parses a CPC sub-frame from a CPC frame. Only `UnnumberedFrame` is supported."""
-    frame_type = cpc_frame.frame_type()
+    frame_type = parse_frame_type(control)
 
     if frame_type != cpc_types.FrameType.UNNUMBERED:
         raise ValueError(f"Unsupported frame type: {frame_type!r}")
 
-    return UnnumberedFrame.from_bytes(cpc_frame.payload)
+    return UnnumberedFrame.from_bytes(payload)
 
 
 class Command:
@@ -126,67 +140,63 @@ class CPCTransportFrame:
     def serialize(self) -> bytes:
         """Serialize the transport frame and compute lengths and checksums."""
         payload = self.payload.to_bytes()
-        length = zigpy.types.uint16_t(len(payload) + 2)
+        header = HEADER.pack(
+            cpc_types.FLAG, self.endpoint, len(payload) + 2, self.control
+        )
 
-        header = (
-            cpc_types.FLAG.serialize()
-            + self.endpoint.serialize()
-            + length.serialize()
-            + self.control.serialize()
+        return b"".join(
+            [
+                header,
+                CHECKSUM.pack(crc16_ccitt(header)),
+                payload,
+                CHECKSUM.pack(crc16_ccitt(payload)),
+            ]
         )
 
-        header_checksum = crc16_ccitt(header).to_bytes(2, "little")
-        payload_checksum = crc16_ccitt(payload).to_bytes(2, "little")
+    @classmethod
+    def deserialize(cls, data: bytes) -> tuple[CPCTransportFrame, bytes]:
+        frame, consumed = cls._deserialize_prefix(data)
 
-        return header + header_checksum + payload + payload_checksum
+        return frame, data[consumed:]
 
     @classmethod
-    def deserialize(cls, data: bytes) -> tuple[CPCTransportFrame, bytes]:
-        if len(data) < 7:
+    def _deserialize_prefix(cls, data: bytes) -> tuple[CPCTransportFrame, int]:
+        """Deserialize a frame from the start of `data`, without copying the rest."""
+        header_size = HEADER.size + CHECKSUM.size
+
+        if len(data) < header_size:
             raise BufferTooShort("Data is too short to contain packet header")
 
-        orig_data = data
-        flag, data = zigpy.types.uint8_t.deserialize(data)
+        flag, endpoint, length, control = HEADER.unpack_from(data, 0)
 
         if flag != cpc_types.FLAG:
             raise ValueError("Invalid flag")
 
-        endpoint, data = cpc_types.EndpointId.deserialize(data)
-        length, data = zigpy.types.uint16_t.deserialize(data)
-        control, data = zigpy.types.uint8_t.deserialize(data)
-        header_checksum, data = zigpy.types.uint16_t.deserialize(data)
+        (header_checksum,) = CHECKSUM.unpack_from(data, HEADER.size)
 
-        if crc16_ccitt(orig_data[:5]) != header_checksum:
+        if crc16_ccitt(data[: HEADER.size]) != header_checksum:
             raise ValueError("Invalid header checksum")
 
-        if len(data) < length:
+        if len(data) < header_size + length:
             raise BufferTooShort("Data is too short to contain packet payload")
 
-        payload, data = data[: length - 2], data[length - 2 :]
-        payload_checksum, data = zigpy.types.uint16_t.deserialize(data)
+        payload = data[header_size : header_size + length - 2]
+        (payload_checksum,) = CHECKSUM.unpack_from(data, header_size + length - 2)
 
         if crc16_ccitt(payload) != payload_checksum:
             raise ValueError("Invalid payload checksum")
 
+        # The frame is only constructed once its payload has been fully parsed
         frame = cls(
-            endpoint=endpoint,
-            control=control,
-            payload=payload,
+            endpoint=cpc_types.EndpointId(endpoint),
+            control=zigpy.types.uint8_t(control),
+            payload=parse_subframe(control, payload),
         )
 
-        frame_with_parsed_payload = dataclasses.replace(
-            frame, payload=parse_subframe(frame)
-        )
-
-        return frame_with_parsed_payload, data
+        return frame, header_size + length
 
     def frame_type(self) -> cpc_types.FrameType:
-        frame_type = (self.control & 0b11000000) >> 6
-
-        if frame_type == 0:
-            frame_type = 1
-
-        return cpc_types.FrameType(frame_type)
+        return parse_frame_type(self.control)
 
     def seq(self) -> int:
         return (self.control & 0b01110000) >> 4
@@ -282,18 +292,30 @@ class CPCProtocol(SerialProtocol):
     def data_received(self, data: bytes) -> None:
         super().data_received(data)
 
+        # Deleting from the front of a `bytearray` is amortized O(1), consumed data is
+        # trimmed in place instead of re-allocating the remaining buffer
         while self._buffer:
+            # Noise is discarded up to the next flag with a single `find`
+            index = self._buffer.find(cpc_types.FLAG)
+
+            if index == -1:
+                _LOGGER.debug("Discarding buffer without a flag: %r", self._buffer)
+                self._buffer.clear()
+                break
+            elif index > 0:
+                del self._buffer[:index]
+
             try:
-                frame, new_buffer = CPCTransportFrame.deserialize(self._buffer)
-                self._buffer = typing.cast(bytearray, new_buffer)
+                frame, consumed = CPCTransportFrame._deserialize_prefix(self._buffer)
             except BufferTooShort:
                 break
             except ValueError as e:
-                self._buffer = self._buffer[
-                    self._buffer.find(bytes([cpc_types.FLAG])) :
-                ]
                 _LOGGER.debug("Failed to parse buffer %r: %r", self._buffer, e)
+
+                # Skip past the current flag to resynchronize on the next one
+                del self._buffer[:1]
             else:
+                del self._buffer[:consumed]
                 self.frame_received(frame)
 
     def frame_received(self, frame: CPCTransportFrame) -> None:
@@ -1,5 +1,6 @@
 import asyncio
 import contextlib
+import functools
 
 import bellows.config
 import bellows.ezsp
@@ -9,10 +10,10 @@ import zigpy.config
 AFTER_DISCONNECT_DELAY = 0.1
 
 
-@contextlib.asynccontextmanager
-async def connect_ezsp(port: str, baudrate: int = 115200) -> bellows.ezsp.EZSP:
-    """Context manager to return a connected EZSP instance for a serial port."""
-    app_config = zigpy.config.CONFIG_SCHEMA(
+@functools.lru_cache(maxsize=32)
+def _build_app_config(port: str, baudrate: int) -> dict:
+    """Build a validated zigpy application config. Cached, `EZSP` never modifies it."""
+    return zigpy.config.CONFIG_SCHEMA(
         {
             zigpy.config.CONF_DEVICE: {
                 zigpy.config.CONF_DEVICE_PATH: port,
@@ -38,6 +39,11 @@ async def connect_ezsp(port: str, baudrate: int = 115200) -> bellows.ezsp.EZSP:
         }
     )
 
+
+@contextlib.asynccontextmanager
+async def connect_ezsp(port: str, baudrate: int = 115200) -> bellows.ezsp.EZSP:
+    """Context manager to return a connected EZSP instance for a serial port."""
+    app_config = _build_app_config(port, baudrate)
     ezsp = await bellows.ezsp.EZSP.initialize(app_config)
 
     try:
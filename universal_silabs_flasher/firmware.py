@@ -8,7 +8,7 @@ import typing
 from zigpy.ota.validators import ValidationError, parse_silabs_ebl, parse_silabs_gbl
 import zigpy.types as zigpy_t
 
-from .common import Version, pad_to_multiple
+from .common import Version
 from .const import FirmwareImageType
 
 _LOGGER = logging.getLogger(__name__)
@@ -131,13 +131,46 @@ class NabuCasaMetadata:
 class FirmwareImage:
     tags: list[tuple[GBLTagId, bytes]]
 
+    # Serialized images are padded to a multiple of this size
+    PADDING_MULTIPLE: typing.ClassVar[int] = 1
+
     @classmethod
     def from_bytes(cls, data: bytes) -> FirmwareImage:
         raise NotImplementedError()
 
-    def serialize(self) -> bytes:
+    def serialize_tag_header(self, tag_id: GBLTagId | EBLTagId, value: bytes) -> bytes:
         raise NotImplementedError()
 
+    def serialize(self) -> bytes:
+        return bytes(self.serialize_padded(self.PADDING_MULTIPLE))
+
+    def serialize_padded(self, multiple: int, padding: bytes = b"\xFF") -> bytearray:
+        """Serialize the image directly into a buffer padded to `multiple` bytes."""
+        assert len(padding) == 1
+
+        if multiple % self.PADDING_MULTIPLE != 0:
+            raise ValueError(
+                f"Padding multiple must be a multiple of {self.PADDING_MULTIPLE}:"
+                f" {multiple}"
+            )
+
+        headers = [self.serialize_tag_header(t, v) for t, v in self.tags]
+        size = sum(len(h) + len(v) for h, (_, v) in zip(headers, self.tags))
+
+        data = bytearray(size + (-size % multiple))
+        offset = 0
+
+        for header, (_, value) in zip(headers, self.tags):
+            data[offset : offset + len(header)] = header
+            offset += len(header)
+
+            data[offset : offset + len(value)] = value
+            offset += len(value)
+
+        data[offset:] = padding * (len(data) - offset)
+
+        return data
+
     def get_first_tag(self, tag_id: GBLTagId) -> bytes:
         try:
             return next(v for t, v in self.tags if t == tag_id)
@@ -147,6 +180,8 @@ class FirmwareImage:
 
 @dataclasses.dataclass(frozen=True)
 class GBLImage(FirmwareImage):
+    PADDING_MULTIPLE: typing.ClassVar[int] = 4
+
     @classmethod
     def from_bytes(cls, data: bytes) -> GBLImage:
         if isinstance(data, memoryview):
@@ -160,17 +195,8 @@ class GBLImage(FirmwareImage):
 
         return cls(tags=tags)
 
-    def serialize(self) -> bytes:
-        return pad_to_multiple(
-            b"".join(
-                [
-                    tag_id.serialize() + len(value).to_bytes(4, "little") + value
-                    for tag_id, value in self.tags
-                ]
-            ),
-            4,
-            b"\xFF",
-        )
+    def serialize_tag_header(self, tag_id: GBLTagId | EBLTagId, value: bytes) -> bytes:
+        return tag_id.serialize() + len(value).to_bytes(4, "little")
 
     def get_nabucasa_metadata(self) -> NabuCasaMetadata:
         metadata = self.get_first_tag(GBLTagId.METADATA)
@@ -180,6 +206,8 @@ class GBLImage(FirmwareImage):
 
 @dataclasses.dataclass(frozen=True)
 class EBLImage(FirmwareImage):
+    PADDING_MULTIPLE: typing.ClassVar[int] = 64
+
     @classmethod
     def from_bytes(cls, data: bytes) -> EBLImage:
         tags = []
@@ -190,17 +218,8 @@ class EBLImage(FirmwareImage):
 
         return cls(tags=tags)
 
-    def serialize(self) -> bytes:
-        return pad_to_multiple(
-            b"".join(
-                [
-                    tag_id.serialize() + len(value).to_bytes(2, "big") + value
-                    for tag_id, value in self.tags
-                ]
-            ),
-            64,
-            b"\xFF",
-        )
+    def serialize_tag_header(self, tag_id: GBLTagId | EBLTagId, value: bytes) -> bytes:
+        return tag_id.serialize() + len(value).to_bytes(2, "big")
 
     def get_nabucasa_metadata(self) -> NabuCasaMetadata:
         raise KeyError("Metadata not supported for EBL")
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import asyncio
 import dataclasses
+import functools
 import logging
 import typing
 
@@ -10,13 +11,7 @@ import bellows.config
 import bellows.ezsp
 import bellows.types
 
-from .common import (
-    PROBE_TIMEOUT,
-    SerialProtocol,
-    Version,
-    connect_protocol,
-    pad_to_multiple,
-)
+from .common import PROBE_TIMEOUT, SerialProtocol, Version, connect_protocol
 from .const import DEFAULT_BAUDRATES, GPIO_CONFIGS, ApplicationType, ResetTarget
 from .cpc import CPCProtocol
 from .emberznet import connect_ezsp
@@ -29,6 +24,7 @@ from .xmodemcrc import BLOCK_SIZE as XMODEM_BLOCK_SIZE
 _LOGGER = logging.getLogger(__name__)
 
 EZSP_BOOTLOADER_LAUNCH_DELAY = 5
+APPLICATION_LAUNCH_DELAY = 1
 
 
 @dataclasses.dataclass(frozen=True)
@@ -39,6 +35,13 @@ class ProbeResult:
 
 
 class Flasher:
+    _PROBE_METHODS: typing.ClassVar[dict[ApplicationType, str]] = {
+        ApplicationType.GECKO_BOOTLOADER: "probe_gecko_bootloader",
+        ApplicationType.CPC: "probe_cpc",
+        ApplicationType.EZSP: "probe_ezsp",
+        ApplicationType.SPINEL: "probe_spinel",
+    }
+
     def __init__(
         self,
         *,
@@ -66,7 +69,7 @@ class Flasher:
         )
 
     async def enter_bootloader_reset(self, target):
-        _LOGGER.info(f"Triggering {target.value} bootloader")
+        _LOGGER.info("Triggering %s bootloader", target.value)
         if target in GPIO_CONFIGS.keys():
             config = GPIO_CONFIGS[target]
             await send_gpio_pattern(
@@ -110,7 +113,10 @@ class Flasher:
                     await gecko.run_firmware()
                     _LOGGER.info("Launched application from bootloader")
 
-            await asyncio.sleep(1)
+            # Only wait for the application to start if one was launched, the
+            # bootloader itself is immediately ready to be connected to again
+            if run_firmware:
+                await asyncio.sleep(APPLICATION_LAUNCH_DELAY)
         except NoFirmwareError:
             _LOGGER.warning("No application can be launched")
             return ProbeResult(
@@ -172,16 +178,14 @@ class Flasher:
         # other probe methods
         only_probe_bootloader = types == [ApplicationType.GECKO_BOOTLOADER]
         run_firmware = self._reset_target and not only_probe_bootloader
+
+        # Probe methods are bound once per call, respecting instance overrides
         probe_funcs = {
-            ApplicationType.GECKO_BOOTLOADER: (
-                lambda baudrate: self.probe_gecko_bootloader(
-                    run_firmware=run_firmware, baudrate=baudrate
-                )
-            ),
-            ApplicationType.CPC: self.probe_cpc,
-            ApplicationType.EZSP: self.probe_ezsp,
-            ApplicationType.SPINEL: self.probe_spinel,
+            method: getattr(self, name) for method, name in self._PROBE_METHODS.items()
         }
+        probe_funcs[ApplicationType.GECKO_BOOTLOADER] = functools.partial(
+            probe_funcs[ApplicationType.GECKO_BOOTLOADER], run_firmware=run_firmware
+        )
 
         for probe_method, baudrate in (
             (m, b) for m in types for b in self._baudrates[m]
@@ -280,10 +284,8 @@ class Flasher:
         run_firmware: bool = True,
         progress_callback: typing.Callable[[int, int], typing.Any] | None = None,
     ) -> None:
-        data = firmware.serialize()
-
         # Pad the image to the XMODEM block size
-        data = pad_to_multiple(data, XMODEM_BLOCK_SIZE, b"\xFF")
+        data = firmware.serialize_padded(XMODEM_BLOCK_SIZE)
 
         async with self._connect_gecko_bootloader(self.bootloader_baudrate) as gecko:
             await gecko.probe()
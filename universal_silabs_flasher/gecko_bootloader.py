@@ -25,18 +25,28 @@ class NoFirmwareError(Exception):
 MENU_AFTER_UPLOAD_TIMEOUT = 0.5
 RUN_APPLICATION_DELAY = 0.1
 
+# Unparsed data beyond this size is discarded, keeping only enough of the end of the
+# buffer to contain the longest message we parse
+MAX_BUFFER_SIZE = 4096
+MAX_MESSAGE_SIZE = 256
+
 MENU_REGEX = re.compile(
-    rb"\r\n(?P<type>Gecko|\w+ Serial) Bootloader v(?P<version>.*?)\r\n"
+    rb"\r\n(?P<type>Gecko|\w+ Serial) Bootloader v(?P<version>[^\r\n]{1,64})\r\n"
     rb"1\. upload (?:gbl|ebl)\r\n"
     rb"2\. run\r\n"
     rb"3\. ebl info\r\n"
     rb"BL > "
 )
+MENU_PROMPT = b"BL > "
 
+# The message of an aborted upload ends at a NUL, at the next line (or the menu that
+# follows it), or after 128 bytes, so a missing terminator cannot stall the upload
 UPLOAD_STATUS_REGEX = re.compile(
-    rb"\r\nSerial upload (?P<status>complete|aborted)\r\n"
-    rb"(?P<message>.*?)\x00?",
-    flags=re.DOTALL,
+    rb"\r\nSerial upload (?:"
+    rb"(?P<complete>complete)\r\n\x00?"
+    rb"|aborted\r\n\x00*(?P<message>[^\x00\r\n]{0,128})"
+    rb"(?:\x00|(?=\r)|(?<=[^\x00\r\n]{128}))"
+    rb")"
 )  # fmt: skip
 
 
@@ -55,6 +65,10 @@ class GeckoBootloaderOption(bytes, enum.Enum):
     EBL_INFO = b"3"
 
 
+# Ember bootloader requires a newline, it is sent along with the option in one write
+EBL_INFO_COMMAND = b"\n" + GeckoBootloaderOption.EBL_INFO.value
+
+
 class GeckoBootloaderProtocol(SerialProtocol):
     def __init__(self) -> None:
         super().__init__()
@@ -62,9 +76,12 @@ class GeckoBootloaderProtocol(SerialProtocol):
             states=list(State),
             initial=State.WAITING_FOR_MENU,
         )
-        self._version: str | None = None
+        self._version: Version | None = None
         self._upload_status: str | None = None
 
+        # Bytes of the buffer that have already been searched for the menu prompt
+        self._scan_offset: int = 0
+
     async def probe(self) -> Version:
         """Attempt to communicate with the bootloader."""
         async with async_timeout.timeout(PROBE_TIMEOUT):
@@ -74,14 +91,12 @@ class GeckoBootloaderProtocol(SerialProtocol):
         """Select `ebl info` in the menu and return the bootloader version."""
         self._state_machine.state = State.WAITING_FOR_MENU
 
-        # Ember bootloader requires a newline
-        self.send_data(b"\n")
-        self.send_data(GeckoBootloaderOption.EBL_INFO)
+        self.send_data(EBL_INFO_COMMAND)
 
         await self._state_machine.wait_for_state(State.IN_MENU)
 
         assert self._version is not None
-        return Version(self._version)
+        return self._version
 
     async def run_firmware(self) -> None:
         """Select `run` in the menu."""
@@ -145,42 +160,55 @@ class GeckoBootloaderProtocol(SerialProtocol):
     def data_received(self, data: bytes) -> None:
         super().data_received(data)
 
-        while self._buffer:
-            _LOGGER.debug("Parsing %s: %r", self._state_machine.state, self._buffer)
-            if self._state_machine.state == State.WAITING_FOR_MENU:
-                match = MENU_REGEX.search(self._buffer)
+        if len(self._buffer) > MAX_BUFFER_SIZE:
+            del self._buffer[:-MAX_MESSAGE_SIZE]
+            self._scan_offset = 0
 
-                if match is None:
-                    return
+        # Every transition enters a state that ignores data, so at most one transition
+        # can happen per callback
+        state = self._state_machine.state
+        _LOGGER.debug("Parsing %s: %r", state, self._buffer)
 
-                self._version = match.group("version").decode("ascii")
-                _LOGGER.debug("Detected version string %r", self._version)
+        if state == State.WAITING_FOR_MENU:
+            # Only new data is searched for the prompt ending the menu
+            scanned = min(self._scan_offset, len(self._buffer))
+            start = max(0, scanned - len(MENU_PROMPT) + 1)
+            self._scan_offset = len(self._buffer)
 
-                self._buffer.clear()
-                self._state_machine.state = State.IN_MENU
-            elif self._state_machine.state == State.WAITING_XMODEM_READY:
-                if not self._buffer.endswith(b"C"):
-                    break
+            if self._buffer.find(MENU_PROMPT, start) == -1:
+                return
 
-                self._buffer.clear()
-                self._state_machine.state = State.XMODEM_READY
-            elif self._state_machine.state == State.WAITING_UPLOAD_DONE:
-                match = UPLOAD_STATUS_REGEX.search(self._buffer)
+            match = MENU_REGEX.search(self._buffer)
 
-                if match is None:
-                    return
+            if match is None:
+                return
 
-                status = match.group("status").decode("ascii")
+            self._version = Version(match.group("version").decode("ascii"))
+            _LOGGER.debug("Detected version %r", self._version)
 
-                if status == "complete":
-                    self._upload_status = status
-                else:
-                    self._upload_status = match.group("message").decode("ascii")
+            self._buffer.clear()
+            self._scan_offset = 0
+            self._state_machine.state = State.IN_MENU
+        elif state == State.WAITING_XMODEM_READY:
+            if not self._buffer.endswith(b"C"):
+                return
 
-                del self._buffer[: match.span()[1]]
-                self._state_machine.state = State.UPLOAD_DONE
+            self._buffer.clear()
+            self._scan_offset = 0
+            self._state_machine.state = State.XMODEM_READY
+        elif state == State.WAITING_UPLOAD_DONE:
+            match = UPLOAD_STATUS_REGEX.search(self._buffer)
 
-                _LOGGER.debug("Upload status: %s", self._upload_status)
+            if match is None:
+                return
+
+            if match.group("complete") is not None:
+                self._upload_status = "complete"
             else:
-                # Ignore data otherwise
-                break
+                self._upload_status = match.group("message").decode("ascii")
+
+            del self._buffer[: match.span()[1]]
+            self._scan_offset = 0
+            self._state_machine.state = State.UPLOAD_DONE
+
+            _LOGGER.debug("Upload status: %s", self._upload_status)
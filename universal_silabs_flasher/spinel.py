@@ -13,6 +13,17 @@ from .spinel_types import CommandID, HDLCSpecial, PropertyID, ResetReason
 
 _LOGGER = logging.getLogger(__name__)
 
+HDLC_FLAG = bytes([HDLCSpecial.FLAG])
+HDLC_ESCAPED_BYTES = frozenset(
+    {
+        HDLCSpecial.FLAG,
+        HDLCSpecial.ESCAPE,
+        HDLCSpecial.XON,
+        HDLCSpecial.XOFF,
+        HDLCSpecial.VENDOR,
+    }
+)
+
 
 @dataclasses.dataclass(frozen=True)
 class HDLCLiteFrame:
@@ -23,19 +34,13 @@ class HDLCLiteFrame:
         encoded = bytearray()
 
         for byte in payload:
-            if byte in (
-                HDLCSpecial.FLAG,
-                HDLCSpecial.ESCAPE,
-                HDLCSpecial.XON,
-                HDLCSpecial.XOFF,
-                HDLCSpecial.VENDOR,
-            ):
+            if byte in HDLC_ESCAPED_BYTES:
                 encoded.append(HDLCSpecial.ESCAPE)
                 byte ^= 0x20
 
             encoded.append(byte)
 
-        return bytes([HDLCSpecial.FLAG]) + bytes(encoded) + bytes([HDLCSpecial.FLAG])
+        return HDLC_FLAG + bytes(encoded) + HDLC_FLAG
 
     @classmethod
     def from_bytes(cls, data: bytes) -> HDLCLiteFrame:
@@ -46,13 +51,7 @@ class HDLCLiteFrame:
             if unescaping:
                 byte ^= 0x20
 
-                if byte not in (
-                    HDLCSpecial.FLAG,
-                    HDLCSpecial.ESCAPE,
-                    HDLCSpecial.XON,
-                    HDLCSpecial.XOFF,
-                    HDLCSpecial.VENDOR,
-                ):
+                if byte not in HDLC_ESCAPED_BYTES:
                     raise ValueError(f"Invalid unescaped byte: 0x{byte:02X}")
 
                 unescaping = False
@@ -112,34 +111,52 @@ class SpinelProtocol(SerialProtocol):
     def data_received(self, data: bytes) -> None:
         super().data_received(data)
 
-        self._buffer = self._buffer.lstrip(bytes([HDLCSpecial.FLAG]))
+        offset = 0
+        frames: list[SpinelFrame] = []
+        failed_chunks: list[tuple[int, int]] = []
 
-        if bytes([HDLCSpecial.FLAG]) not in self._buffer:
-            return
+        # Chunks are read through a view of the buffer, only the consumed prefix is
+        # removed once all complete chunks have been parsed
+        with memoryview(self._buffer) as view:
+            while True:
+                # Flag bytes can come before and after any packet, any number of times
+                index = self._buffer.find(HDLC_FLAG, offset)
 
-        while self._buffer:
-            # Flag bytes can come before and after any packet, any number of times
-            chunk, _, self._buffer = self._buffer.partition(bytes([HDLCSpecial.FLAG]))
+                if index == -1:
+                    break
 
-            if not chunk:
-                continue
+                start, offset = offset, index + 1
 
-            # Decode the HDLC frame
-            try:
-                hdlc_frame = HDLCLiteFrame.from_bytes(chunk)
-            except ValueError:
-                _LOGGER.debug("Failed to decode HDLC chunk %r", chunk)
-                continue
+                with view[start:index] as chunk:
+                    if not chunk:
+                        continue
 
-            _LOGGER.debug("Decoded HDLC frame: %r", hdlc_frame)
+                    # Decode the HDLC frame
+                    try:
+                        hdlc_frame = HDLCLiteFrame.from_bytes(chunk)
+                    except ValueError:
+                        failed_chunks.append((start, index))
+                        continue
 
-            # And finally the Spinel frame
-            try:
-                spinel_frame = SpinelFrame.from_bytes(hdlc_frame.data)
-            except ValueError as e:
-                _LOGGER.debug("Failed to decode Spinel frame: %r", e)
-                continue
+                _LOGGER.debug("Decoded HDLC frame: %r", hdlc_frame)
+
+                # And finally the Spinel frame
+                try:
+                    spinel_frame = SpinelFrame.from_bytes(hdlc_frame.data)
+                except ValueError as e:
+                    _LOGGER.debug("Failed to decode Spinel frame: %r", e)
+                    continue
+
+                frames.append(spinel_frame)
+
+        # Failed chunks are only copied for logging once the view has been released
+        for start, end in failed_chunks:
+            _LOGGER.debug("Failed to decode HDLC chunk %r", self._buffer[start:end])
+
+        del self._buffer[:offset]
 
+        # Frames are only handled once the buffer is no longer exported by the view
+        for spinel_frame in frames:
             self.frame_received(spinel_frame)
 
     def frame_received(self, frame: SpinelFrame) -> None:
@@ -39,10 +39,12 @@ class XmodemCRCPacket:
     def serialize(self) -> bytes:
         """Serialize the packet, computing header and payload checksums."""
         assert len(self.payload) == BLOCK_SIZE
-        return (
-            bytes([PacketType.SOH, self.number, 0xFF - self.number])
-            + self.payload
-            + crc16_ccitt(self.payload).to_bytes(2, "big")
+        return b"".join(
+            [
+                bytes([PacketType.SOH, self.number, 0xFF - self.number]),
+                self.payload,
+                crc16_ccitt(self.payload).to_bytes(2, "big"),
+            ]
         )
 
 
@@ -117,10 +119,13 @@ async def send_xmodem128_crc(
         # FIXME: ensure any subsequent "C"s have been cleared so they do not interfere
         reader._buffer.clear()
 
+        # Blocks are read through a view of the image to avoid copying each payload
+        view = memoryview(data)
+
         for index in range(0, len(data) // BLOCK_SIZE):
             packet = XmodemCRCPacket(
                 number=(index + 1) & 0xFF,  # `seq` starts at 1 and then wraps
-                payload=data[BLOCK_SIZE * index : BLOCK_SIZE * (index + 1)],
+                payload=view[BLOCK_SIZE * index : BLOCK_SIZE * (index + 1)],
             )
 
             # Send the packet